@@ -2,13 +2,12 @@ package bucket
 
 import (
 	"bufio"
+	"bytes"
 	"fmt"
 	"io"
 	"os"
-	"regexp"
 	"strings"
 	"time"
-	"unicode"
 
 	"github.com/aws/aws-sdk-go-v2/service/s3"
 	"github.com/aws/aws-sdk-go-v2/service/s3/types"
@@ -24,8 +23,6 @@ var PermissionAllowed = uint8(1)
 var PermissionDenied = uint8(0)
 var PermissionUnknown = uint8(2)
 
-var bucketRe = regexp.MustCompile(`[^.\-a-z0-9]`)
-
 type Bucket struct {
 	//gorm.Model
 	ID                uint      `gorm:"primarykey" json:",omitempty"`
@@ -82,46 +79,43 @@ func NewBucket(name string) Bucket {
 	}
 }
 
-func (b *Bucket) String() string {
-	if b.Exists == BucketNotExist {
-		return fmt.Sprintf("%v | bucket_not_exist", b.Name)
-	}
-
-	var authUserPerms []string
-	if b.PermAuthUsersRead == PermissionAllowed {
-		authUserPerms = append(authUserPerms, "READ")
-	}
-	if b.PermAuthUsersWrite == PermissionAllowed {
-		authUserPerms = append(authUserPerms, "WRITE")
-	}
-	if b.PermAuthUsersReadACL == PermissionAllowed {
-		authUserPerms = append(authUserPerms, "READ_ACP")
-	}
-	if b.PermAuthUsersWriteACL == PermissionAllowed {
-		authUserPerms = append(authUserPerms, "WRITE_ACP")
-	}
-	if b.PermAuthUsersFullControl == PermissionAllowed {
-		authUserPerms = append(authUserPerms, "FULL_CONTROL")
+// writePerms appends the allowed permission names for one grantee group to sb, comma-separated
+func writePerms(sb *strings.Builder, read uint8, write uint8, readACL uint8, writeACL uint8, fullControl uint8) {
+	first := true
+	appendPerm := func(perm uint8, name string) {
+		if perm != PermissionAllowed {
+			return
+		}
+		if !first {
+			sb.WriteString(", ")
+		}
+		sb.WriteString(name)
+		first = false
 	}
+	appendPerm(read, "READ")
+	appendPerm(write, "WRITE")
+	appendPerm(readACL, "READ_ACP")
+	appendPerm(writeACL, "WRITE_ACP")
+	appendPerm(fullControl, "FULL_CONTROL")
+}
 
-	var allUsersPerms []string
-	if b.PermAllUsersRead == PermissionAllowed {
-		allUsersPerms = append(allUsersPerms, "READ")
-	}
-	if b.PermAllUsersWrite == PermissionAllowed {
-		allUsersPerms = append(allUsersPerms, "WRITE")
-	}
-	if b.PermAllUsersReadACL == PermissionAllowed {
-		allUsersPerms = append(allUsersPerms, "READ_ACP")
-	}
-	if b.PermAllUsersWriteACL == PermissionAllowed {
-		allUsersPerms = append(allUsersPerms, "WRITE_ACP")
-	}
-	if b.PermAllUsersFullControl == PermissionAllowed {
-		allUsersPerms = append(allUsersPerms, "FULL_CONTROL")
+func (b *Bucket) String() string {
+	if b.Exists == BucketNotExist {
+		return b.Name + " | bucket_not_exist"
 	}
 
-	return fmt.Sprintf("AuthUsers: [%v] | AllUsers: [%v]", strings.Join(authUserPerms, ", "), strings.Join(allUsersPerms, ", "))
+	// Build the whole result in one buffer instead of joining intermediate permission slices - this runs once
+	// per result line
+	var sb strings.Builder
+	sb.Grow(64)
+	sb.WriteString("AuthUsers: [")
+	writePerms(&sb, b.PermAuthUsersRead, b.PermAuthUsersWrite, b.PermAuthUsersReadACL, b.PermAuthUsersWriteACL,
+		b.PermAuthUsersFullControl)
+	sb.WriteString("] | AllUsers: [")
+	writePerms(&sb, b.PermAllUsersRead, b.PermAllUsersWrite, b.PermAllUsersReadACL, b.PermAllUsersWriteACL,
+		b.PermAllUsersFullControl)
+	sb.WriteString("]")
+	return sb.String()
 }
 
 func (b *Bucket) Permissions() map[*types.Grantee]map[string]uint8 {
@@ -145,9 +139,12 @@ func (b *Bucket) Permissions() map[*types.Grantee]map[string]uint8 {
 
 func FromReader(r io.Reader, bucketChan chan Bucket) error {
 	scanner := bufio.NewScanner(r)
+	// Wordlists run to millions of lines - read in large chunks and trim whitespace before converting to a
+	// string, so each line costs one allocation instead of several
+	scanner.Buffer(make([]byte, 256*1024), bufio.MaxScanTokenSize)
 	bucketsSeen := make(map[string]struct{})
 	for scanner.Scan() {
-		bucketName := strings.TrimSpace(scanner.Text())
+		bucketName := string(bytes.TrimSpace(scanner.Bytes()))
 		if !IsValidS3BucketName(bucketName) {
 			log.Info(fmt.Sprintf("invalid   | %s", bucketName))
 			continue
@@ -234,30 +231,34 @@ func Permission(canDo bool) uint8 {
 	return PermissionDenied
 }
 
+func isBucketChar(c byte) bool {
+	return c == '.' || c == '-' || ('a' <= c && c <= 'z') || ('0' <= c && c <= '9')
+}
+
+func isBucketAlnum(c byte) bool {
+	return ('a' <= c && c <= 'z') || ('0' <= c && c <= '9')
+}
+
 func IsValidS3BucketName(bucketName string) bool {
-	// TODO: Optimize the heck out of this
 	/*
 		Bucket names must not be formatted as an IP address (for example, 192.168.5.4).
 	*/
 
-	// Bucket names can consist only of lowercase letters, numbers, dots (.), and hyphens (-).
-	if bucketRe.MatchString(bucketName) {
-		return false
-	}
-
 	// Bucket names must be between 3 (min) and 63 (max) characters long.
 	if len(bucketName) < 3 || len(bucketName) > 63 {
 		return false
 	}
 
 	// Bucket names must begin and end with a letter or number.
-	firstChar := []rune(bucketName[0:1])[0]
-	lastChar := []rune(bucketName[len(bucketName)-1:])[0]
-	if !unicode.IsLetter(firstChar) && !unicode.IsNumber(firstChar) {
+	if !isBucketAlnum(bucketName[0]) || !isBucketAlnum(bucketName[len(bucketName)-1]) {
 		return false
 	}
-	if !unicode.IsLetter(lastChar) && !unicode.IsNumber(lastChar) {
-		return false
+
+	// Bucket names can consist only of lowercase letters, numbers, dots (.), and hyphens (-).
+	for i := 1; i < len(bucketName)-1; i++ {
+		if !isBucketChar(bucketName[i]) {
+			return false
+		}
 	}
 
 	// Bucket names must not start with the prefix 'xn--'
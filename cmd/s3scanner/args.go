@@ -7,16 +7,17 @@ import (
 )
 
 type ArgCollection struct {
-	BucketFile   string
-	BucketName   string
-	DoEnumerate  bool
-	JSON         bool
-	ProviderFlag string
-	Threads      int
-	UseMq        bool
-	Verbose      bool
-	Version      bool
-	WriteToDB    bool
+	BucketFile     string
+	BucketName     string
+	DoEnumerate    bool
+	JSON           bool
+	MaxConnections int
+	ProviderFlag   string
+	Threads        int
+	UseMq          bool
+	Verbose        bool
+	Version        bool
+	WriteToDB      bool
 }
 
 func (args ArgCollection) Validate() error {
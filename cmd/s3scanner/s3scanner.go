@@ -13,10 +13,14 @@ import (
 	"github.com/spf13/viper"
 	"github.com/streadway/amqp"
 	"os"
+	"os/signal"
 	"reflect"
+	"runtime"
 	"strings"
 	"sync"
+	"syscall"
 	"text/tabwriter"
+	"time"
 )
 
 type flagSetting struct {
@@ -88,16 +92,30 @@ func usage() {
 }
 
 var flagSettings = map[string]flagSetting{
-	"provider":    {category: CategoryOptions},
-	"bucket":      {category: CategoryInput},
-	"bucket-file": {category: CategoryInput},
-	"mq":          {category: CategoryInput},
-	"threads":     {category: CategoryOptions},
-	"verbose":     {category: CategoryDebug},
-	"version":     {category: CategoryDebug},
-	"db":          {category: CategoryOutput},
-	"json":        {category: CategoryOutput},
-	"enumerate":   {category: CategoryOptions},
+	"provider":        {category: CategoryOptions},
+	"bucket":          {category: CategoryInput},
+	"bucket-file":     {category: CategoryInput},
+	"mq":              {category: CategoryInput},
+	"threads":         {category: CategoryOptions},
+	"max-connections": {category: CategoryOptions},
+	"verbose":         {category: CategoryDebug},
+	"version":         {category: CategoryDebug},
+	"db":              {category: CategoryOutput},
+	"json":            {category: CategoryOutput},
+	"enumerate":       {category: CategoryOptions},
+}
+
+// defaultThreads sizes the worker pools for a network-bound workload: four per core, capped so we don't hammer
+// providers from large machines by default
+func defaultThreads() int {
+	t := runtime.NumCPU() * 4
+	if t > 32 {
+		t = 32
+	}
+	if t < 4 {
+		t = 4
+	}
+	return t
 }
 
 func Run(version string) {
@@ -121,7 +139,9 @@ func Run(version string) {
 	flag.BoolVar(&args.JSON, "json", false, "Print logs to stdout in JSON format instead of human-readable.")
 
 	flag.BoolVar(&args.DoEnumerate, "enumerate", false, "Enumerate bucket objects (can be time-consuming).")
-	flag.IntVar(&args.Threads, "threads", 4, "Number of threads to scan with.")
+	flag.IntVar(&args.Threads, "threads", defaultThreads(), "Number of threads to scan with.")
+	flag.IntVar(&args.MaxConnections, "max-connections", 0,
+		"HTTP connections pooled per host. 0 sizes the pool from the thread count.")
 	flag.BoolVar(&args.Verbose, "verbose", false, "Enable verbose logging.")
 	flag.BoolVar(&args.Version, "version", false, "Print version")
 
@@ -144,19 +164,43 @@ func Run(version string) {
 	if args.Verbose {
 		log.SetLevel(log.DebugLevel)
 	}
-	log.SetOutput(os.Stdout)
+	// Buffer stdout so workers don't pay one write syscall per result line. The logrus exit handler covers
+	// Fatal paths; later exits go through log.Exit so the buffer is flushed first.
+	out := log2.NewBufferedWriter(os.Stdout)
+	out.AutoFlush(500 * time.Millisecond)
+	log.SetOutput(out)
+	log.RegisterExitHandler(func() { _ = out.Flush() })
+	// Long scans are routinely ended with ctrl-c - and MQ mode only ever exits that way - so flush any
+	// buffered results before dying on SIGINT/SIGTERM. log.Exit runs the exit handler registered above.
+	sigs := make(chan os.Signal, 1)
+	signal.Notify(sigs, os.Interrupt, syscall.SIGTERM)
+	go func() {
+		<-sigs
+		log.Exit(1)
+	}()
 	if args.JSON {
 		log.SetFormatter(&log2.NestedJSONFormatter{})
 	} else {
 		log.SetFormatter(&log.TextFormatter{DisableTimestamp: true})
 	}
 
+	// Size the shared HTTP connection pools before any provider builds a client
+	if args.MaxConnections > 0 {
+		provider.SetMaxConnections(args.MaxConnections)
+	} else {
+		provider.SetMaxConnections(args.Threads * 2)
+	}
+
+	// Bucket.Objects is only read when results go to the database or JSON output - otherwise enumeration can
+	// drop individual keys as it pages and keep just the totals
+	provider.SetKeepEnumeratedObjects(args.WriteToDB || args.JSON)
+
 	var p provider.StorageProvider
 	var err error
 	configErr := validateConfig(args)
 	if configErr != nil {
 		log.Error(configErr)
-		os.Exit(1)
+		log.Exit(1)
 	}
 	if args.ProviderFlag == "custom" {
 		if viper.IsSet("providers.custom") {
@@ -168,14 +212,14 @@ func Run(version string) {
 				viper.GetString("providers.custom.endpoint_format"))
 			if err != nil {
 				log.Error(err)
-				os.Exit(1)
+				log.Exit(1)
 			}
 		}
 	} else {
 		p, err = provider.NewProvider(args.ProviderFlag)
 		if err != nil {
 			log.Error(err)
-			os.Exit(1)
+			log.Exit(1)
 		}
 	}
 
@@ -186,31 +230,46 @@ func Run(version string) {
 		dbErr := db.Connect(dbConfig, true)
 		if dbErr != nil {
 			log.Error(dbErr)
-			os.Exit(1)
+			log.Exit(1)
 		}
 	}
 
 	var wg sync.WaitGroup
 
 	if !args.UseMq {
-		buckets := make(chan bucket.Bucket)
+		// Small buffers let the reader parse ahead and smooth hand-off between stages without
+		// materializing the whole input list in memory
+		buckets := make(chan bucket.Bucket, args.Threads*2)
+		found := make(chan bucket.Bucket, args.Threads*2)
 
+		// Pipeline: one pool of workers does the cheap existence checks, a second pool runs the slower
+		// permission scans on buckets which exist. Splitting the stages keeps existence checks flowing
+		// while earlier buckets are still being scanned.
+		var existsWg sync.WaitGroup
+		for i := 0; i < args.Threads; i++ {
+			existsWg.Add(1)
+			go worker.CheckExists(&existsWg, buckets, found, p, args.JSON)
+		}
 		for i := 0; i < args.Threads; i++ {
 			wg.Add(1)
-			go worker.Work(&wg, buckets, p, args.DoEnumerate, args.WriteToDB, args.JSON)
+			go worker.Scan(&wg, found, p, args.DoEnumerate, args.WriteToDB, args.JSON)
 		}
+		go func() {
+			existsWg.Wait()
+			close(found)
+		}()
 
 		if args.BucketFile != "" {
 			err := bucket.ReadFromFile(args.BucketFile, buckets)
 			close(buckets)
 			if err != nil {
 				log.Error(err)
-				os.Exit(1)
+				log.Exit(1)
 			}
 		} else if args.BucketName != "" {
 			if !bucket.IsValidS3BucketName(args.BucketName) {
 				log.Info(fmt.Sprintf("invalid   | %s", args.BucketName))
-				os.Exit(0)
+				log.Exit(0)
 			}
 			c := bucket.NewBucket(strings.ToLower(args.BucketName))
 			buckets <- c
@@ -218,7 +277,7 @@ func Run(version string) {
 		}
 
 		wg.Wait()
-		os.Exit(0)
+		log.Exit(0)
 	}
 
 	// Setup mq connection and spin off consumers
@@ -236,4 +295,7 @@ func Run(version string) {
 	}
 	log.Printf("Waiting for messages. To exit press CTRL+C")
 	wg.Wait()
+	// Consumers only return on error - exit through the handler that flushes buffered output so the error
+	// explaining why they died isn't dropped
+	log.Exit(0)
 }
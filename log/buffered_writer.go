@@ -0,0 +1,43 @@
+package log
+
+import (
+	"bufio"
+	"io"
+	"sync"
+	"time"
+)
+
+// BufferedWriter wraps an io.Writer with a mutex-guarded bufio.Writer so worker log lines reach the underlying
+// file descriptor in large chunks instead of one write syscall per line. logrus already serializes its writes,
+// but Flush may be called from other goroutines, so all access is locked.
+type BufferedWriter struct {
+	mu sync.Mutex
+	w  *bufio.Writer
+}
+
+func NewBufferedWriter(w io.Writer) *BufferedWriter {
+	return &BufferedWriter{w: bufio.NewWriterSize(w, 64*1024)}
+}
+
+func (b *BufferedWriter) Write(p []byte) (int, error) {
+	b.mu.Lock()
+	defer b.mu.Unlock()
+	return b.w.Write(p)
+}
+
+// Flush writes any buffered log lines to the underlying writer
+func (b *BufferedWriter) Flush() error {
+	b.mu.Lock()
+	defer b.mu.Unlock()
+	return b.w.Flush()
+}
+
+// AutoFlush flushes the buffer every interval so long-running scans still emit results promptly. It runs for the
+// life of the process.
+func (b *BufferedWriter) AutoFlush(interval time.Duration) {
+	go func() {
+		for range time.Tick(interval) {
+			_ = b.Flush()
+		}
+	}()
+}
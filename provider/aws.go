@@ -7,7 +7,7 @@ import (
 	"github.com/aws/aws-sdk-go-v2/aws"
 	"github.com/aws/aws-sdk-go-v2/feature/ec2/imds"
 	"github.com/sa7mon/s3scanner/permission"
-	"net/http"
+	"sync"
 	"time"
 
 	awshttp "github.com/aws/aws-sdk-go-v2/aws/transport/http"
@@ -23,6 +23,37 @@ type AWS struct {
 	existsClient   *s3.Client
 	clients        *clientmap.ClientMap
 	hasCredentials bool
+
+	// bucket name -> region, so repeat checks of a bucket (e.g. queue redeliveries) skip the network round-trip
+	regionMu    sync.Mutex
+	regionCache map[string]string
+}
+
+func (a *AWS) cachedRegion(bucketName string) (string, bool) {
+	a.regionMu.Lock()
+	defer a.regionMu.Unlock()
+	region, ok := a.regionCache[bucketName]
+	return region, ok
+}
+
+// maxRegionCacheEntries bounds the region cache. Bucket-file scans deduplicate names upstream and check each
+// bucket once, so the cache only pays off on MQ redeliveries - it must not grow one permanent entry per bucket
+// on large scans.
+const maxRegionCacheEntries = 1024
+
+func (a *AWS) cacheRegion(bucketName string, region string) {
+	a.regionMu.Lock()
+	defer a.regionMu.Unlock()
+	if len(a.regionCache) >= maxRegionCacheEntries {
+		// Entries never expire, so drop arbitrary ones (map iteration order is random) until there's room
+		for name := range a.regionCache {
+			if len(a.regionCache) < maxRegionCacheEntries {
+				break
+			}
+			delete(a.regionCache, name)
+		}
+	}
+	a.regionCache[bucketName] = region
 }
 
 func (a *AWS) BucketExists(b *bucket.Bucket) (*bucket.Bucket, error) {
@@ -30,12 +61,20 @@ func (a *AWS) BucketExists(b *bucket.Bucket) (*bucket.Bucket, error) {
 	if !bucket.IsValidS3BucketName(b.Name) {
 		return nil, errors.New("invalid bucket name")
 	}
+	if region, ok := a.cachedRegion(b.Name); ok {
+		log.WithFields(log.Fields{"method": "aws.BucketExists()",
+			"bucket_name": b.Name, "region": region}).Debugf("region cache hit - bucket exists")
+		b.Exists = bucket.BucketExists
+		b.Region = region
+		return b, nil
+	}
 	region, err := manager.GetBucketRegion(context.TODO(), a.existsClient, b.Name)
 	if err == nil {
 		log.WithFields(log.Fields{"method": "aws.BucketExists()",
 			"bucket_name": b.Name, "region": region}).Debugf("no error - bucket exists")
 		b.Exists = bucket.BucketExists
 		b.Region = region
+		a.cacheRegion(b.Name, region)
 		return b, nil
 	}
 	log.WithFields(log.Fields{"method": "aws.BucketExists()",
@@ -50,12 +89,52 @@ func (a *AWS) BucketExists(b *bucket.Bucket) (*bucket.Bucket, error) {
 		// AccessDenied implies the bucket exists
 		b.Exists = bucket.BucketExists
 		b.Region = region
+		if region != "" {
+			a.cacheRegion(b.Name, region)
+		}
 		return b, nil
 	}
-	// Error wasn't BucketNotFound or 403
+	// Error wasn't BucketNotFound or 403 - with credentials, GetBucketLocation may still settle the question
+	// for buckets the caller owns
+	if a.hasCredentials {
+		if located, ok := a.locationFallback(b); ok {
+			return located, nil
+		}
+	}
 	return b, err
 }
 
+// locationFallback resolves existence and region via GetBucketLocation. The call is denied for every bucket
+// the credentials don't own, so it's only worth trying after anonymous resolution has failed - calling it
+// first would add a guaranteed AccessDenied round-trip per bucket on credentialed scans.
+func (a *AWS) locationFallback(b *bucket.Bucket) (*bucket.Bucket, bool) {
+	authClient, authErr := a.getRegionClient("us-east-1", true)
+	if authErr != nil {
+		return nil, false
+	}
+	loc, locErr := authClient.GetBucketLocation(context.TODO(), &s3.GetBucketLocationInput{Bucket: &b.Name})
+	if locErr == nil {
+		region := string(loc.LocationConstraint)
+		if region == "" { // An empty LocationConstraint means us-east-1
+			region = "us-east-1"
+		}
+		log.WithFields(log.Fields{"method": "aws.locationFallback()",
+			"bucket_name": b.Name, "region": region}).Debugf("GetBucketLocation succeeded - bucket exists")
+		b.Exists = bucket.BucketExists
+		b.Region = region
+		a.cacheRegion(b.Name, region)
+		return b, true
+	}
+	var locRespErr *awshttp.ResponseError
+	if errors.As(locErr, &locRespErr) && locRespErr.HTTPStatusCode() == 404 {
+		b.Exists = bucket.BucketNotExist
+		return b, true
+	}
+	log.WithFields(log.Fields{"method": "aws.locationFallback()",
+		"bucket_name": b.Name}).Debug(locErr)
+	return nil, false
+}
+
 func (a *AWS) Scan(b *bucket.Bucket, doDestructiveChecks bool) error {
 	anonClient, anonErr := a.getRegionClient(b.Region, false)
 	if anonErr != nil {
@@ -108,6 +187,7 @@ func NewProviderAWS() (*AWS, error) {
 	pa.hasCredentials = clientHasCreds
 	pa.clients = clientmap.New()
 	pa.clients.Set("us-east-1", clientHasCreds, usEastClient)
+	pa.regionCache = make(map[string]string)
 	return pa, nil
 }
 
@@ -127,9 +207,7 @@ func (*AWS) Name() string {
 func (*AWS) newAnonClient(region string) (*s3.Client, error) {
 	cfg, err := config.LoadDefaultConfig(
 		context.TODO(),
-		config.WithHTTPClient(&http.Client{Transport: &http.Transport{
-			Proxy: http.ProxyFromEnvironment,
-		}}),
+		config.WithHTTPClient(sharedHTTPClient(false)),
 		config.WithRegion(region),
 		config.WithCredentialsProvider(aws.AnonymousCredentials{}),
 	)
@@ -144,9 +222,7 @@ func (a *AWS) newClient(region string) (*s3.Client, error) {
 	logFields := log.Fields{"method": "aws.newClient", "region": region}
 
 	configOpts := []func(*config.LoadOptions) error{
-		config.WithHTTPClient(&http.Client{Transport: &http.Transport{
-			Proxy: http.ProxyFromEnvironment,
-		}}),
+		config.WithHTTPClient(sharedHTTPClient(false)),
 		config.WithRegion(region),
 		config.WithEC2IMDSClientEnableState(imds.ClientDisabled), // Otherwise we wait 4 seconds to IMDSv2 to timeout
 	}
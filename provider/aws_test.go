@@ -1,6 +1,7 @@
 package provider
 
 import (
+	"fmt"
 	"github.com/sa7mon/s3scanner/bucket"
 	"github.com/stretchr/testify/assert"
 	"testing"
@@ -150,3 +151,15 @@ func TestProviderAWS_Enumerate(t *testing.T) {
 	assert.EqualValues(t, 1, b2.NumObjects)
 	assert.EqualValues(t, 1, len(b2.Objects))
 }
+
+func TestProviderAWS_RegionCacheBounded(t *testing.T) {
+	t.Parallel()
+	a := &AWS{regionCache: make(map[string]string)}
+	for i := 0; i < maxRegionCacheEntries*2; i++ {
+		a.cacheRegion(fmt.Sprintf("bucket-%d", i), "us-east-1")
+	}
+	a.regionMu.Lock()
+	size := len(a.regionCache)
+	a.regionMu.Unlock()
+	assert.LessOrEqual(t, size, maxRegionCacheEntries)
+}
@@ -0,0 +1,101 @@
+package provider
+
+import (
+	"context"
+	"net"
+	"sync"
+	"time"
+)
+
+// maxDNSCacheEntries bounds the cache. Virtual-host addressing gives every bucket its own hostname with
+// near-zero reuse, so the cache only needs room for the endpoints that actually repeat.
+const maxDNSCacheEntries = 1024
+
+// cachedDialer wraps net.Dialer with a small DNS cache. The scanner dials the same provider endpoints over and
+// over; Go's resolver doesn't cache lookups, so without this every new connection pays a resolver round-trip.
+type cachedDialer struct {
+	dialer  net.Dialer
+	ttl     time.Duration
+	resolve func(ctx context.Context, host string) ([]string, error)
+
+	mu    sync.Mutex
+	cache map[string]dnsCacheEntry
+}
+
+type dnsCacheEntry struct {
+	addrs   []string
+	expires time.Time
+}
+
+func newCachedDialer(ttl time.Duration) *cachedDialer {
+	return &cachedDialer{
+		dialer:  net.Dialer{Timeout: 30 * time.Second},
+		ttl:     ttl,
+		resolve: net.DefaultResolver.LookupHost,
+		cache:   make(map[string]dnsCacheEntry),
+	}
+}
+
+func (d *cachedDialer) lookup(ctx context.Context, host string) ([]string, error) {
+	d.mu.Lock()
+	entry, ok := d.cache[host]
+	d.mu.Unlock()
+	if ok && time.Now().Before(entry.expires) {
+		return entry.addrs, nil
+	}
+
+	addrs, err := d.resolve(ctx, host)
+	if err != nil {
+		return nil, err
+	}
+	d.store(host, addrs)
+	return addrs, nil
+}
+
+// store inserts a lookup result, keeping the cache bounded so scans where every bucket is a unique hostname
+// don't grow the map forever
+func (d *cachedDialer) store(host string, addrs []string) {
+	now := time.Now()
+	d.mu.Lock()
+	defer d.mu.Unlock()
+	if len(d.cache) >= maxDNSCacheEntries {
+		// Sweep expired entries first; if everything is still live, drop arbitrary entries (map iteration
+		// order is random) until there's room
+		for h, e := range d.cache {
+			if now.After(e.expires) {
+				delete(d.cache, h)
+			}
+		}
+		for h := range d.cache {
+			if len(d.cache) < maxDNSCacheEntries {
+				break
+			}
+			delete(d.cache, h)
+		}
+	}
+	d.cache[host] = dnsCacheEntry{addrs: addrs, expires: now.Add(d.ttl)}
+}
+
+// DialContext resolves addr's host through the cache, then dials the resolved addresses in order. Literal IPs
+// and unparseable addresses are dialed directly.
+func (d *cachedDialer) DialContext(ctx context.Context, network string, addr string) (net.Conn, error) {
+	host, port, err := net.SplitHostPort(addr)
+	if err != nil || net.ParseIP(host) != nil {
+		return d.dialer.DialContext(ctx, network, addr)
+	}
+
+	addrs, lookupErr := d.lookup(ctx, host)
+	if lookupErr != nil || len(addrs) == 0 {
+		return d.dialer.DialContext(ctx, network, addr)
+	}
+
+	var dialErr error
+	for _, a := range addrs {
+		conn, connErr := d.dialer.DialContext(ctx, network, net.JoinHostPort(a, port))
+		if connErr == nil {
+			return conn, nil
+		}
+		dialErr = connErr
+	}
+	return nil, dialErr
+}
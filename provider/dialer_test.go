@@ -0,0 +1,102 @@
+package provider
+
+import (
+	"context"
+	"errors"
+	"fmt"
+	"net"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestCachedDialer_LookupCachesHits(t *testing.T) {
+	t.Parallel()
+	calls := 0
+	d := newCachedDialer(time.Minute)
+	d.resolve = func(_ context.Context, _ string) ([]string, error) {
+		calls++
+		return []string{"192.0.2.1"}, nil
+	}
+
+	addrs, err := d.lookup(context.Background(), "s3.example.com")
+	assert.Nil(t, err)
+	assert.Equal(t, []string{"192.0.2.1"}, addrs)
+
+	_, err = d.lookup(context.Background(), "s3.example.com")
+	assert.Nil(t, err)
+	assert.Equal(t, 1, calls)
+}
+
+func TestCachedDialer_LookupExpires(t *testing.T) {
+	t.Parallel()
+	calls := 0
+	d := newCachedDialer(-time.Second) // entries are already expired when stored
+	d.resolve = func(_ context.Context, _ string) ([]string, error) {
+		calls++
+		return []string{"192.0.2.1"}, nil
+	}
+
+	_, err := d.lookup(context.Background(), "s3.example.com")
+	assert.Nil(t, err)
+	_, err = d.lookup(context.Background(), "s3.example.com")
+	assert.Nil(t, err)
+	assert.Equal(t, 2, calls)
+}
+
+func TestCachedDialer_LookupErrorNotCached(t *testing.T) {
+	t.Parallel()
+	d := newCachedDialer(time.Minute)
+	d.resolve = func(_ context.Context, _ string) ([]string, error) {
+		return nil, errors.New("resolver down")
+	}
+
+	_, err := d.lookup(context.Background(), "s3.example.com")
+	assert.NotNil(t, err)
+	d.mu.Lock()
+	size := len(d.cache)
+	d.mu.Unlock()
+	assert.Equal(t, 0, size)
+}
+
+func TestCachedDialer_CacheBounded(t *testing.T) {
+	t.Parallel()
+	d := newCachedDialer(time.Minute)
+	d.resolve = func(_ context.Context, _ string) ([]string, error) {
+		return []string{"192.0.2.1"}, nil
+	}
+
+	for i := 0; i < maxDNSCacheEntries*2; i++ {
+		_, err := d.lookup(context.Background(), fmt.Sprintf("bucket-%d.s3.amazonaws.com", i))
+		assert.Nil(t, err)
+	}
+	d.mu.Lock()
+	size := len(d.cache)
+	d.mu.Unlock()
+	assert.LessOrEqual(t, size, maxDNSCacheEntries)
+}
+
+func TestCachedDialer_DialFallsBackOnLookupFailure(t *testing.T) {
+	t.Parallel()
+	l, lErr := net.Listen("tcp", "127.0.0.1:0")
+	assert.Nil(t, lErr)
+	defer l.Close()
+	go func() {
+		conn, acceptErr := l.Accept()
+		if acceptErr == nil {
+			conn.Close()
+		}
+	}()
+
+	d := newCachedDialer(time.Minute)
+	d.resolve = func(_ context.Context, _ string) ([]string, error) {
+		return nil, errors.New("resolver down")
+	}
+
+	_, port, splitErr := net.SplitHostPort(l.Addr().String())
+	assert.Nil(t, splitErr)
+	conn, err := d.DialContext(context.Background(), "tcp", net.JoinHostPort("localhost", port))
+	assert.Nil(t, err)
+	conn.Close()
+}
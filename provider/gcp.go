@@ -11,7 +11,8 @@ import (
 // GCP like AWS, has a "universal" endpoint, but unlike AWS GCP does not require you to follow a redirect to the
 // "proper" region. We can simply use storage.googleapis.com as the endpoint for all requests.
 type GCP struct {
-	client *s3.Client
+	client  *s3.Client
+	clients *clientmap.ClientMap
 }
 
 func (g GCP) Insecure() bool {
@@ -32,9 +33,7 @@ func (g GCP) BucketExists(b *bucket.Bucket) (*bucket.Bucket, error) {
 	if !bucket.IsValidS3BucketName(b.Name) {
 		return nil, errors.New("invalid bucket name")
 	}
-	clients := clientmap.New()
-	clients.Set("default", false, g.client)
-	exists, region, err := bucketExists(clients, b)
+	exists, region, err := bucketExists(g.clients, b)
 	if err != nil {
 		return b, err
 	}
@@ -64,6 +63,8 @@ func NewProviderGCP() (*GCP, error) {
 		return pg, err
 	}
 	pg.client = c
+	pg.clients = clientmap.New()
+	pg.clients.Set("default", false, c)
 
 	return pg, nil
 }
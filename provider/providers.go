@@ -7,8 +7,13 @@ import (
 	"fmt"
 	"net/http"
 	"net/url"
+	"slices"
+	"sync"
+	"sync/atomic"
 	"time"
 
+	"golang.org/x/sync/errgroup"
+
 	"github.com/aws/aws-sdk-go-v2/aws"
 	awshttp "github.com/aws/aws-sdk-go-v2/aws/transport/http"
 	"github.com/aws/aws-sdk-go-v2/config"
@@ -82,19 +87,59 @@ func NewProvider(name string) (StorageProvider, error) {
 	return provider, err
 }
 
-func newNonAWSClient(sp StorageProvider, regionURL string) (*s3.Client, error) {
-	var httpClient s3.HTTPClient
-
-	if sp.Insecure() {
-		httpClient = &http.Client{Transport: &http.Transport{
-			Proxy:           http.ProxyFromEnvironment,
-			TLSClientConfig: &tls.Config{InsecureSkipVerify: true},
-		}}
-	} else {
-		httpClient = &http.Client{Transport: &http.Transport{
-			Proxy: http.ProxyFromEnvironment,
-		}}
+var (
+	transportOnce     sync.Once
+	sharedTransport   *http.Transport
+	insecureTransport *http.Transport
+)
+
+// dnsDialer caches endpoint lookups for both shared transports
+var dnsDialer = newCachedDialer(10 * time.Minute)
+
+// maxConnsPerHost sizes the shared transports' per-host connection pools
+var maxConnsPerHost = 16
+
+// SetMaxConnections overrides how many idle connections the shared transports keep per remote host. It must be
+// called before the first provider is constructed - the transports are built once, on first use.
+func SetMaxConnections(n int) {
+	if n > 0 {
+		maxConnsPerHost = n
+	}
+}
+
+func newTransport(insecure bool) *http.Transport {
+	t := &http.Transport{
+		Proxy:               http.ProxyFromEnvironment,
+		DialContext:         dnsDialer.DialContext,
+		MaxIdleConns:        maxConnsPerHost * 8,
+		MaxIdleConnsPerHost: maxConnsPerHost,
+		IdleConnTimeout:     90 * time.Second,
+		// A custom DialContext disables net/http's automatic HTTP/2 support, so opt back in. Providers
+		// that negotiate h2 (e.g. GCP) then multiplex concurrent requests over one connection; the rest
+		// keep using HTTP/1.1.
+		ForceAttemptHTTP2: true,
 	}
+	if insecure {
+		t.TLSClientConfig = &tls.Config{InsecureSkipVerify: true}
+	}
+	return t
+}
+
+// sharedHTTPClient returns an http.Client backed by a transport shared between all S3 clients so that idle
+// connections are pooled and reused across regions instead of each client paying for its own TCP/TLS handshakes
+func sharedHTTPClient(insecure bool) *http.Client {
+	transportOnce.Do(func() {
+		sharedTransport = newTransport(false)
+		insecureTransport = newTransport(true)
+	})
+	if insecure {
+		return &http.Client{Transport: insecureTransport}
+	}
+	return &http.Client{Transport: sharedTransport}
+}
+
+func newNonAWSClient(sp StorageProvider, regionURL string) (*s3.Client, error) {
+	httpClient := sharedHTTPClient(sp.Insecure())
 
 	cfg, err := config.LoadDefaultConfig(
 		context.TODO(),
@@ -116,46 +161,133 @@ func newNonAWSClient(sp StorageProvider, regionURL string) (*s3.Client, error) {
 	return s3.NewFromConfig(cfg, addrStyleOption), nil
 }
 
+const maxEnumeratePages = 5000  // TODO: Should this limit be lowered?
+const enumerateConcurrency = 16 // Concurrent prefix listings per bucket
+
+var errTooManyPages = errors.New("more than 5000 pages of objects found. Skipping for now")
+
+// keepEnumeratedObjects controls whether enumeration records every object in Bucket.Objects or only tallies
+// counts and sizes. Output modes that never read the object list turn this off so huge buckets don't hold
+// millions of keys in memory just to print a total.
+var keepEnumeratedObjects = true
+
+// SetKeepEnumeratedObjects declares whether anything downstream (database writes, JSON output) will read
+// Bucket.Objects. When nothing will, enumeration streams pages and keeps only the totals.
+func SetKeepEnumeratedObjects(keep bool) {
+	keepEnumeratedObjects = keep
+}
+
+// recordObjects tallies a page of listed objects into b. Callers listing concurrently must hold the bucket's
+// enumeration lock.
+func recordObjects(b *bucket.Bucket, contents []types.Object, count *atomic.Int32) {
+	count.Add(int32(len(contents)))
+	if keepEnumeratedObjects {
+		b.Objects = slices.Grow(b.Objects, len(contents))
+	}
+	for _, obj := range contents {
+		if keepEnumeratedObjects {
+			b.Objects = append(b.Objects, bucket.Object{Key: *obj.Key, Size: uint64(*obj.Size)})
+		}
+		b.BucketSize += uint64(*obj.Size)
+	}
+}
+
 /*
-enumerateListObjectsV2 will enumerate all objects stored in b using the ListObjectsV2 API endpoint. The endpoint will
-be called until the IsTruncated field is false
+enumerateListObjectsV2 will enumerate all objects stored in b using the ListObjectsV2 API endpoint.
+
+The top level of the bucket is listed with a '/' delimiter first: root keys are recorded directly and each common
+prefix found is then listed in parallel, so large buckets spread their O(objects/1000) page fetches over
+enumerateConcurrency concurrent listings instead of one sequential chain.
 */
 func enumerateListObjectsV2(client *s3.Client, b *bucket.Bucket) error {
-	var continuationToken *string
-	continuationToken = nil
-	page := 0
-
-	for {
-		log.WithFields(log.Fields{
-			"bucket_name": b.Name,
-			"method":      "providers.enumerateListObjectsV2()",
-		}).Debugf("requesting objects page %d", page)
-		output, err := client.ListObjectsV2(context.TODO(), &s3.ListObjectsV2Input{
-			Bucket:            &b.Name,
-			ContinuationToken: continuationToken,
-			EncodingType:      types.EncodingTypeUrl,
-		},
-		)
+	logger := log.WithFields(log.Fields{
+		"bucket_name": b.Name,
+		"method":      "providers.enumerateListObjectsV2()",
+	})
+	var pages, objectCount atomic.Int32
+	var prefixes []string
+
+	// Record the running count even on error so callers can report partial progress - individual keys may not
+	// be stored
+	defer func() {
+		b.NumObjects = objectCount.Load()
+	}()
+
+	paginator := s3.NewListObjectsV2Paginator(client, &s3.ListObjectsV2Input{
+		Bucket:       &b.Name,
+		EncodingType: types.EncodingTypeUrl,
+		Delimiter:    aws.String("/"),
+	})
+	for paginator.HasMorePages() {
+		logger.Debugf("requesting root objects page %d", pages.Load())
+		if pages.Add(1) > maxEnumeratePages {
+			return errTooManyPages
+		}
+		output, err := paginator.NextPage(context.TODO())
 		if err != nil {
 			return err
 		}
 
-		for _, obj := range output.Contents {
-			b.Objects = append(b.Objects, bucket.Object{Key: *obj.Key, Size: uint64(*obj.Size)})
-			b.BucketSize += uint64(*obj.Size)
+		recordObjects(b, output.Contents, &objectCount)
+		for _, cp := range output.CommonPrefixes {
+			// The listing is URL-encoded but the prefix is sent back in a request, which expects it raw
+			prefix, decodeErr := url.QueryUnescape(*cp.Prefix)
+			if decodeErr != nil {
+				prefix = *cp.Prefix
+			}
+			prefixes = append(prefixes, prefix)
 		}
+	}
 
-		if !*output.IsTruncated {
-			b.ObjectsEnumerated = true
-			break
+	if len(prefixes) > 0 {
+		var mu sync.Mutex
+		g, ctx := errgroup.WithContext(context.TODO())
+		g.SetLimit(enumerateConcurrency)
+		for _, prefix := range prefixes {
+			g.Go(func() error {
+				return enumeratePrefix(ctx, client, b, prefix, &pages, &objectCount, &mu)
+			})
 		}
-		continuationToken = output.NextContinuationToken
-		page++
-		if page >= 5000 { // TODO: Should this limit be lowered?
-			return errors.New("more than 5000 pages of objects found. Skipping for now")
+		if err := g.Wait(); err != nil {
+			return err
+		}
+	}
+
+	b.ObjectsEnumerated = true
+	return nil
+}
+
+// enumeratePrefix lists every object under prefix and records it in b. pages counts requests across all listings
+// of the bucket so the maxEnumeratePages cap applies to the bucket as a whole.
+func enumeratePrefix(ctx context.Context, client *s3.Client, b *bucket.Bucket, prefix string, pages *atomic.Int32,
+	count *atomic.Int32, mu *sync.Mutex) error {
+	logger := log.WithFields(log.Fields{
+		"bucket_name": b.Name,
+		"prefix":      prefix,
+		"method":      "providers.enumeratePrefix()",
+	})
+	page := 0
+
+	paginator := s3.NewListObjectsV2Paginator(client, &s3.ListObjectsV2Input{
+		Bucket:       &b.Name,
+		EncodingType: types.EncodingTypeUrl,
+		Prefix:       aws.String(prefix),
+	})
+	for paginator.HasMorePages() {
+		logger.Debugf("requesting objects page %d", page)
+		if pages.Add(1) > maxEnumeratePages {
+			return errTooManyPages
+		}
+		output, err := paginator.NextPage(ctx)
+		if err != nil {
+			return err
 		}
+
+		mu.Lock()
+		recordObjects(b, output.Contents, count)
+		mu.Unlock()
+		page++
 	}
-	b.NumObjects = int32(len(b.Objects))
 	return nil
 }
 
@@ -178,7 +310,11 @@ func checkPermissions(client *s3.Client, b *bucket.Bucket, doDestructiveChecks b
 		return fmt.Errorf("error occurred while checking for ReadACL: %v", err.Error())
 	}
 	b.PermAllUsersReadACL = bucket.Permission(canReadACL)
-	// TODO: Can we skip the rest of the checks if READ_ACP is allowed?
+	if canReadACL {
+		// The ACL covers grants for every grantee, so a successful read already filled in all the
+		// permissions - no further API calls needed
+		return nil
+	}
 
 	// We can skip the rest of the checks if FullControl is allowed
 	if b.PermAuthUsersFullControl == bucket.PermissionAllowed {
@@ -213,15 +349,19 @@ func checkPermissions(client *s3.Client, b *bucket.Bucket, doDestructiveChecks b
 // bucketExists takes a bucket name and checks if it exists in any region contained in clients
 func bucketExists(clients *clientmap.ClientMap, b *bucket.Bucket) (bool, string, error) {
 	results := make(chan bucketCheckResult, clients.Len())
-	e := make(chan error, 1)
+	e := make(chan error, clients.Len())
+
+	// As soon as one region gives an authoritative answer, cancel the checks still in flight
+	ctx, cancel := context.WithCancel(context.TODO())
+	defer cancel()
 
 	clients.Each(func(region string, _ bool, client *s3.Client) {
 		go func(bucketName string, client *s3.Client, region string) {
-			logFields := log.Fields{
+			logger := log.WithFields(log.Fields{
 				"bucket_name": b.Name,
 				"region":      region,
 				"method":      "providers.bucketExists()",
-			}
+			})
 			var regionErr error
 
 			// Unlike other APIs, Scaleway returns '200 OK' to a HEAD request sent to the wrong region for a
@@ -229,16 +369,21 @@ func bucketExists(clients *clientmap.ClientMap, b *bucket.Bucket) (bool, string,
 			// Scaleway will return 404 to the GET request in any region other than the one the bucket belongs to.
 			// See https://github.com/sa7mon/S3Scanner/issues/209 for a better way to fix this.
 			if b.Provider == "scaleway" {
-				_, regionErr = client.ListObjectsV2(context.TODO(), &s3.ListObjectsV2Input{
+				_, regionErr = client.ListObjectsV2(ctx, &s3.ListObjectsV2Input{
 					Bucket:  &b.Name,
 					MaxKeys: aws.Int32(1),
 				})
 			} else {
-				_, regionErr = manager.GetBucketRegion(context.TODO(), client, bucketName)
+				_, regionErr = manager.GetBucketRegion(ctx, client, bucketName)
+			}
+
+			if errors.Is(regionErr, context.Canceled) {
+				// Another region already answered and cancelled us
+				return
 			}
 
 			if regionErr == nil {
-				log.WithFields(logFields).Debugf("no error - bucket exists")
+				logger.Debugf("no error - bucket exists")
 				results <- bucketCheckResult{region: region, exists: true}
 				return
 			}
@@ -247,13 +392,13 @@ func bucketExists(clients *clientmap.ClientMap, b *bucket.Bucket) (bool, string,
 			var nsb *types.NoSuchBucket    // Can be returned from ListObjectsV2()
 			var re2 *awshttp.ResponseError
 			if errors.As(regionErr, &bnf) {
-				log.WithFields(logFields).Debugf("BucketNotFound")
+				logger.Debugf("BucketNotFound")
 				results <- bucketCheckResult{region: region, exists: false}
 			} else if errors.As(regionErr, &nsb) {
-				log.WithFields(logFields).Debugf("BucketNotFound")
+				logger.Debugf("BucketNotFound")
 				results <- bucketCheckResult{region: region, exists: false}
 			} else if errors.As(regionErr, &re2) && re2.HTTPStatusCode() == 403 {
-				log.WithFields(logFields).Debugf("AccessDenied")
+				logger.Debugf("AccessDenied")
 				results <- bucketCheckResult{region: region, exists: true}
 			} else {
 				// If regionErr is a ResponseError, only return the unwrapped error i.e. "Method Not Allowed"
@@ -262,7 +407,7 @@ func bucketExists(clients *clientmap.ClientMap, b *bucket.Bucket) (bool, string,
 				if errors.As(regionErr, &re2) {
 					err = re2.Unwrap()
 				}
-				log.WithFields(logFields).Debug(fmt.Errorf("unhandled error: %w", regionErr))
+				logger.Debug(fmt.Errorf("unhandled error: %w", regionErr))
 				e <- err
 			}
 		}(b.Name, client, region)
@@ -281,6 +426,25 @@ func bucketExists(clients *clientmap.ClientMap, b *bucket.Bucket) (bool, string,
 	return false, "", nil
 }
 
+var (
+	headClientOnce sync.Once
+	headClient     *http.Client
+)
+
+// getHeadClient returns the http.Client used for raw bucket HEAD probes. It never follows redirects - the 301
+// response and its `x-amz-bucket-region` header are the signal we're after, so chasing the redirect would just
+// cost an extra round-trip for a body we throw away.
+func getHeadClient() *http.Client {
+	headClientOnce.Do(func() {
+		headClient = sharedHTTPClient(false)
+		headClient.CheckRedirect = func(_ *http.Request, _ []*http.Request) error {
+			return http.ErrUseLastResponse
+		}
+		headClient.Timeout = 15 * time.Second
+	})
+	return headClient
+}
+
 // bucketExists301 takes a bucket name and checks if it exists. It assumes the server will respond with a 301 status
 // and `x-amz-bucket-region` header pointing to the correct region if an incorrect region is specified.
 func bucketExists301(client *s3.Client, region string, b *bucket.Bucket) (bool, string, error) {
@@ -298,7 +462,7 @@ func bucketExists301(client *s3.Client, region string, b *bucket.Bucket) (bool,
 	if reqErr != nil {
 		return false, "", logErr(logFields, reqErr)
 	}
-	res, resErr := client.Options().HTTPClient.Do(req)
+	res, resErr := getHeadClient().Do(req)
 	if resErr != nil {
 		return false, "", logErr(logFields, resErr)
 	}
@@ -1,15 +1,11 @@
 package provider
 
 import (
-	"context"
 	"errors"
 	"fmt"
-	"github.com/aws/aws-sdk-go-v2/aws"
-	"github.com/aws/aws-sdk-go-v2/config"
 	"github.com/aws/aws-sdk-go-v2/service/s3"
 	"github.com/sa7mon/s3scanner/bucket"
 	"github.com/sa7mon/s3scanner/provider/clientmap"
-	"net/http"
 )
 
 type Wasabi struct {
@@ -62,29 +58,6 @@ func (w *Wasabi) getRegionClient(region string) *s3.Client {
 	return w.clients.Get(region, false)
 }
 
-func (w *Wasabi) newExistsClient() (*s3.Client, error) {
-	client := &http.Client{
-		CheckRedirect: func(_ *http.Request, _ []*http.Request) error { // don't follow redirects
-			return http.ErrUseLastResponse
-		},
-		Transport: &http.Transport{
-			Proxy: http.ProxyFromEnvironment,
-		},
-	}
-	cfg, err := config.LoadDefaultConfig(
-		context.TODO(),
-		config.WithCredentialsProvider(aws.AnonymousCredentials{}),
-		config.WithHTTPClient(client),
-		config.WithRegion("auto"),
-	)
-	if err != nil {
-		return nil, err
-	}
-
-	cfg.BaseEndpoint = aws.String("https://s3.wasabisys.com")
-	return s3.NewFromConfig(cfg, func(o *s3.Options) { o.UsePathStyle = true }), nil
-}
-
 func NewProviderWasabi() (*Wasabi, error) {
 	w := new(Wasabi)
 	clients, err := w.newClients()
@@ -93,7 +66,9 @@ func NewProviderWasabi() (*Wasabi, error) {
 	}
 	w.clients = clients
 
-	c, cErr := w.newExistsClient()
+	// bucketExists301 sends its HEAD requests through the shared non-redirecting
+	// client, so the exists client only needs to supply the canonical endpoint
+	c, cErr := newNonAWSClient(w, "https://s3.wasabisys.com")
 	if cErr != nil {
 		return w, cErr
 	}
@@ -6,12 +6,11 @@ import (
 	"testing"
 )
 
-func TestWasabi_NewExistsClient(t *testing.T) {
+func TestWasabi_ExistsClient(t *testing.T) {
 	t.Parallel()
 	w, wErr := NewProviderWasabi()
 	assert.Nil(t, wErr)
-	_, err := w.newExistsClient()
-	assert.Nil(t, err)
+	assert.NotNil(t, w.existsClient)
 }
 
 func TestWasabi_BucketExists(t *testing.T) {
@@ -83,12 +83,14 @@ func WorkMQ(threadID int, wg *sync.WaitGroup, conn *amqp.Connection, provider pr
 					continue
 				}
 
-				log.WithFields(log.Fields{"method": "main.mqwork()",
-					"bucket_name": b.Name, "region": b.Region}).Debugf("enumerating objects...")
+				if log.IsLevelEnabled(log.DebugLevel) {
+					log.WithFields(log.Fields{"method": "main.mqwork()",
+						"bucket_name": b.Name, "region": b.Region}).Debugf("enumerating objects...")
+				}
 
 				enumErr := provider.Enumerate(b)
 				if enumErr != nil {
-					log.Errorf("Error enumerating bucket '%s': %v\nEnumerated objects: %v", b.Name, enumErr, len(b.Objects))
+					log.Errorf("Error enumerating bucket '%s': %v\nEnumerated objects: %v", b.Name, enumErr, b.NumObjects)
 					FailOnError(j.Reject(false), "failed to reject")
 				}
 			}
@@ -1,7 +1,6 @@
 package worker
 
 import (
-	"fmt"
 	"github.com/dustin/go-humanize"
 	"github.com/sa7mon/s3scanner/bucket"
 	"github.com/sa7mon/s3scanner/db"
@@ -21,11 +20,12 @@ func PrintResult(b *bucket.Bucket, json bool) {
 		return
 	}
 
-	result := fmt.Sprintf("exists    | %v | %v | %v", b.Name, b.Region, b.String())
 	if b.ObjectsEnumerated {
-		result = fmt.Sprintf("%v | %v objects (%v)", result, len(b.Objects), humanize.Bytes(b.BucketSize))
+		log.Infof("exists    | %v | %v | %v | %v objects (%v)", b.Name, b.Region, b.String(), b.NumObjects,
+			humanize.Bytes(b.BucketSize))
+	} else {
+		log.Infof("exists    | %v | %v | %v", b.Name, b.Region, b.String())
 	}
-	log.Info(result)
 }
 
 func Work(wg *sync.WaitGroup, buckets chan bucket.Bucket, provider provider.StorageProvider, doEnumerate bool,
@@ -43,28 +43,68 @@ func Work(wg *sync.WaitGroup, buckets chan bucket.Bucket, provider provider.Stor
 			continue
 		}
 
-		// Scan permissions
-		scanErr := provider.Scan(b, false)
-		if scanErr != nil {
-			log.WithFields(log.Fields{"bucket": b}).Error(scanErr)
+		scanBucket(b, provider, doEnumerate, writeToDB, json)
+	}
+}
+
+// CheckExists reads buckets from `in`, checks whether they exist, and forwards live buckets to `out`. Buckets that
+// don't exist are reported here and dropped so the scan workers only spend time on buckets with permissions to check.
+// The existence check is a single round-trip, so decoupling it from the slower permission scan keeps many more
+// checks in flight for the same number of workers.
+func CheckExists(wg *sync.WaitGroup, in chan bucket.Bucket, out chan bucket.Bucket,
+	provider provider.StorageProvider, json bool) {
+	defer wg.Done()
+	for b1 := range in {
+		b, existsErr := provider.BucketExists(&b1)
+		if existsErr != nil {
+			log.Errorf("error     | %s | %s", b.Name, existsErr.Error())
+			continue
+		}
+
+		if b.Exists == bucket.BucketNotExist {
+			PrintResult(b, json)
+			continue
 		}
 
-		if doEnumerate && b.PermAllUsersRead == bucket.PermissionAllowed {
+		out <- *b
+	}
+}
+
+// Scan reads buckets known to exist from `in`, scans their permissions, optionally enumerates objects, and reports
+// the results
+func Scan(wg *sync.WaitGroup, in chan bucket.Bucket, provider provider.StorageProvider, doEnumerate bool,
+	writeToDB bool, json bool) {
+	defer wg.Done()
+	for b := range in {
+		scanBucket(&b, provider, doEnumerate, writeToDB, json)
+	}
+}
+
+func scanBucket(b *bucket.Bucket, provider provider.StorageProvider, doEnumerate bool, writeToDB bool, json bool) {
+	// Scan permissions
+	scanErr := provider.Scan(b, false)
+	if scanErr != nil {
+		log.WithFields(log.Fields{"bucket": b}).Error(scanErr)
+	}
+
+	if doEnumerate && b.PermAllUsersRead == bucket.PermissionAllowed {
+		// Skip building the Fields map when debug logging is off - this runs once per bucket
+		if log.IsLevelEnabled(log.DebugLevel) {
 			log.WithFields(log.Fields{"method": "main.work()",
 				"bucket_name": b.Name, "region": b.Region}).Debugf("enumerating objects...")
-			enumErr := provider.Enumerate(b)
-			if enumErr != nil {
-				log.Errorf("Error enumerating bucket '%s': %v\nEnumerated objects: %v", b.Name, enumErr, len(b.Objects))
-				continue
-			}
 		}
-		PrintResult(b, json)
+		enumErr := provider.Enumerate(b)
+		if enumErr != nil {
+			log.Errorf("Error enumerating bucket '%s': %v\nEnumerated objects: %v", b.Name, enumErr, b.NumObjects)
+			return
+		}
+	}
+	PrintResult(b, json)
 
-		if writeToDB {
-			dbErr := db.StoreBucket(b)
-			if dbErr != nil {
-				log.Error(dbErr)
-			}
+	if writeToDB {
+		dbErr := db.StoreBucket(b)
+		if dbErr != nil {
+			log.Error(dbErr)
 		}
 	}
 }